@@ -271,7 +271,10 @@ class Language(Button):
             self.set_label(self.formatter.format(language=language))
 
         logger.debug(
-            f"[Language] Keyboard: {keyboard}, Language: {language}, Match: {matched}"
+            "[Language] Keyboard: {}, Language: {}, Match: {}",
+            keyboard,
+            language,
+            matched,
         )
         return matched
 
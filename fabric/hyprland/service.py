@@ -5,7 +5,7 @@ from collections.abc import Callable
 from typing import ParamSpec, Concatenate, Any
 from fabric.core.service import Service, Signal, Property
 
-from fabric.utils.helpers import idle_add
+from fabric.utils.helpers import IdleQueue
 from gi.repository import (
     Gio,
     GLib,
@@ -26,9 +26,9 @@ class HyprlandSocketError(Exception): ...
 class HyprlandSocketNotFoundError(Exception): ...
 
 
-# dataclasses with frozen flag
+# slotted dataclasses with frozen flag
 # to avoid unexpected changes
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HyprlandEvent:
     name: str
     "the name of the received event"
@@ -38,7 +38,7 @@ class HyprlandEvent:
     "the data as it's from the socket's event, it may be formatted as following `event-name>>event-data1,event-data2`"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HyprlandReply:
     command: str
     "the passed in command"
@@ -87,6 +87,8 @@ class Hyprland(Service):
         """
         super().__init__(**kwargs)
         self._ready = False
+        # events that arrive while the main loop is busy share one idle source
+        self._events_queue = IdleQueue(self.handle_raw_event, "HyprlandService")
         self.lookup_socket()  # set the above constants
 
         # all aboard...
@@ -267,7 +269,7 @@ class Hyprland(Service):
                 )
                 continue
 
-            idle_add(self.handle_raw_event, raw_data[0])
+            self._events_queue.push(raw_data[0])
 
         logger.warning("[HyprlandService] events socket thread ended")
         return False
@@ -224,7 +224,7 @@ class HyprlandLanguage(Language):
                 continue
 
             logger.debug(
-                f"[Language] found language: {language} for keyboard {kb_name}"
+                "[Language] found language: {} for keyboard {}", language, kb_name
             )
             break
 
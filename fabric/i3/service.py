@@ -7,7 +7,7 @@ from loguru import logger
 from typing import ParamSpec
 from dataclasses import dataclass
 from fabric.core.service import Service, Signal, Property
-from fabric.utils.helpers import exec_shell_command, idle_add
+from fabric.utils.helpers import exec_shell_command, IdleQueue
 from gi.repository import GLib
 
 P = ParamSpec("P")
@@ -58,7 +58,7 @@ class I3MessageType(IntEnum):
     INPUT_EVENT = 0x80000015
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class I3Event:
     name: str
     "the name of the received event"
@@ -68,7 +68,7 @@ class I3Event:
     "the raw json data"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class I3Reply:
     command: str
     "the passed in command"
@@ -97,6 +97,8 @@ class I3(Service):
         super().__init__(**kwargs)
 
         self._ready = False
+        # events that arrive while the main loop is busy share one idle source
+        self._events_queue = IdleQueue(self.handle_raw_event, "I3Service")
         self.lookup_socket()
 
         self.event_socket_thread = GLib.Thread.new(
@@ -210,7 +212,7 @@ class I3(Service):
                 self.unpack(sock)  # success reply
 
                 while True:
-                    idle_add(self.handle_raw_event, *self.unpack(sock))
+                    self._events_queue.push(*self.unpack(sock))
 
         except Exception as e:
             logger.warning(f"[I3Service] events socket thread ended with an error: {e}")
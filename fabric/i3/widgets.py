@@ -86,7 +86,7 @@ class I3Workspaces(Workspaces):
             case "urgent":
                 self.urgent(ws_id)
 
-        return logger.debug(f"[I3Workspaces] Event: {change}, Workspace ID: {ws_id}")
+        return logger.debug("[I3Workspaces] Event: {}, Workspace ID: {}", change, ws_id)
 
     # override signals from super class
     def do_action_next(self):
@@ -163,7 +163,7 @@ class I3ActiveWindow(ActiveWindow):
             self.do_initialize()
 
         return logger.debug(
-            f"[I3ActiveWindow] Event: {change}, Container: {container.get('name')}"
+            "[I3ActiveWindow] Event: {}, Container: {}", change, container.get("name")
         )
 
 
@@ -228,7 +228,7 @@ class I3Language(Language):
             if self.layout_changed(language, kb_name):
                 active_language = language
                 logger.debug(
-                    f"[Language] Found language: {language} for keyboard {kb_name}"
+                    "[Language] Found language: {} for keyboard {}", language, kb_name
                 )
                 break
 
@@ -8,6 +8,7 @@ import shlex
 import string
 import random
 import inspect
+import threading
 from enum import Enum
 from loguru import logger
 from functools import wraps
@@ -935,6 +936,53 @@ def idle_add(func: Callable, *args, pin: bool = False) -> int:
     )  # a hack to safely pass a pointer to user's data
 
 
+class IdleQueue:
+    """
+    a thread-safe queue that invokes `handler` in the main thread for each pushed item
+    items pushed while the queue is waiting to be drained share a single idle source
+    """
+
+    def __init__(self, handler: Callable[..., Any], name: str = "IdleQueue"):
+        """
+        :param handler: the function to be called with the arguments of each pushed item
+        :type handler: Callable[..., Any]
+        :param name: the name used to prefix error logs, defaults to "IdleQueue"
+        :type name: str, optional
+        """
+        self.handler = handler
+        self.name = name
+        self._items: list[tuple] = []
+        self._lock = threading.Lock()
+        self._drain_scheduled = False
+
+    def push(self, *args) -> None:
+        """
+        queue an item, safe to call from any thread
+
+        :param args: arguments will be passed to the handler
+        """
+        with self._lock:
+            self._items.append(args)
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        idle_add(self.drain)
+
+    def drain(self) -> None:
+        """handle all the queued items in order, called in the main thread"""
+        with self._lock:
+            items, self._items = self._items, []
+            self._drain_scheduled = False
+
+        for args in items:
+            try:
+                self.handler(*args)
+            except Exception as e:
+                logger.exception(
+                    f"[{self.name}] got error while handling queued item ({e})"
+                )
+
+
 def remove_handler(handler_id: int):
     return GLib.source_remove(handler_id)
 
@@ -0,0 +1,83 @@
+import unittest
+from unittest import mock
+from fabric.hyprland.service import Hyprland
+from fabric.i3.service import I3
+
+
+class TestServiceEventsQueue(unittest.TestCase):
+    def setUp(self):
+        self.idle_sources = []
+        patcher = mock.patch(
+            "fabric.utils.helpers.idle_add",
+            side_effect=lambda func, *args: self.idle_sources.append((func, args)),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def runIdleSources(self):
+        sources, self.idle_sources = self.idle_sources, []
+        for func, args in sources:
+            func(*args)
+
+    def testHyprlandEventsOrder(self):
+        with (
+            mock.patch.object(Hyprland, "lookup_socket"),
+            mock.patch.object(Hyprland, "handle_raw_event") as handler,
+        ):
+            service = Hyprland(commands_only=True)
+            for raw_event in (b"a>>1", b"b>>2", b"c>>3"):
+                service._events_queue.push(raw_event)
+
+            self.assertEqual(len(self.idle_sources), 1)
+            self.runIdleSources()
+            self.assertEqual(
+                handler.call_args_list,
+                [mock.call(b"a>>1"), mock.call(b"b>>2"), mock.call(b"c>>3")],
+            )
+
+            # a drained queue should schedule a new idle source
+            service._events_queue.push(b"d>>4")
+            self.assertEqual(len(self.idle_sources), 1)
+            self.runIdleSources()
+            self.assertEqual(handler.call_args, mock.call(b"d>>4"))
+
+    def testI3EventsOrder(self):
+        with (
+            mock.patch.object(I3, "lookup_socket"),
+            mock.patch("fabric.i3.service.GLib"),
+            mock.patch.object(I3, "handle_raw_event") as handler,
+        ):
+            service = I3()
+            service._events_queue.push(1, "{}")
+            service._events_queue.push(2, "{}")
+
+            self.assertEqual(len(self.idle_sources), 1)
+            self.runIdleSources()
+            self.assertEqual(
+                handler.call_args_list, [mock.call(1, "{}"), mock.call(2, "{}")]
+            )
+
+    def testEventErrorKeepsDraining(self):
+        with (
+            mock.patch.object(Hyprland, "lookup_socket"),
+            mock.patch.object(
+                Hyprland, "handle_raw_event", side_effect=[ValueError, None]
+            ) as handler,
+            mock.patch("fabric.utils.helpers.logger") as logger,
+        ):
+            service = Hyprland(commands_only=True)
+            service._events_queue.push(b"\xff")
+            service._events_queue.push(b"b>>2")
+
+            self.runIdleSources()
+            self.assertEqual(handler.call_count, 2)
+            self.assertEqual(handler.call_args, mock.call(b"b>>2"))
+
+            # the error should be logged along with its traceback
+            logger.exception.assert_called_once()
+            self.assertIn("[HyprlandService]", logger.exception.call_args.args[0])
+            logger.error.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()